@@ -5,8 +5,10 @@ retry logic that is triggered in case of occurrence of specific error status cod
 are generated as a response to the API call. The function is used across the different
 modules of the watchlist_api_client library when a connection is to be reused by multiple
 calls to the server (for example when crawling the API directory structure or when
-downloading data from the server).
+downloading data from the server). Threads that share the work of a single task get a
+session of their own through thread_get_session.
 """
+import threading
 from typing import Tuple
 
 import requests
@@ -47,3 +49,25 @@ def create_session(
         ),
     )
     return session
+
+
+thread_local = threading.local()
+
+
+def thread_get_session() -> requests.Session:
+    """Creates a thread-specific session object.
+
+    The thread-specific session object is required to ensure thread safety when using
+    requests.Session(). When calling thread_get_session(), a session will be allocated
+    exclusively to the thread that originally invoked the function. Once the session
+    object is created, it will be reused by the thread on each subsequent call throughout
+    its entire lifetime.
+
+    Returns
+    -------
+    requests.Session
+        A requests.Session object.
+    """
+    if not hasattr(thread_local, "session"):
+        thread_local.session = create_session()
+    return thread_local.session
@@ -1,19 +1,36 @@
 """Implements a crawler for the Datavault API.
 
-The crawler uses a depth-first search traversal algorithm to scan the directory tree
+The crawler uses a breadth-first search traversal algorithm to scan the directory tree
 underlying a pre-defined Datavault API endpoint, to discover all the files available to
-download in the tree underneath that specific endpoint.
+download in the tree underneath that specific endpoint. The nodes belonging to the same
+level of the directory tree are queried concurrently, so that the time spent crawling the
+tree grows with the depth of the tree rather than with the number of its directories.
 """
+import concurrent.futures
 import datetime
-from typing import Dict, List, Optional, Tuple
-import urllib.parse
+import functools
+from itertools import repeat
+from typing import Callable, Dict, List, Optional, Tuple, Union, cast
 
 import requests
 
-from datavault_api_client.connectivity import create_session
+from datavault_api_client.connectivity import create_session, thread_get_session
 from datavault_api_client.data_structures import DiscoveredFileInfo
 
 
+json_loads: "Callable[[bytes], List[DataVaultNode]]"
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+
+DATAVAULT_API_URL = "https://api.icedatavault.icedataservices.com"
+
+DataVaultNode = Dict[str, Union[str, int, bool]]
+
+
+@functools.lru_cache(maxsize=65536)
 def clean_raw_filename(raw_filename: str) -> str:
     """Cleans a raw DataVault file name.
 
@@ -42,11 +59,12 @@ def clean_raw_filename(raw_filename: str) -> str:
         belongs to any other DataVault file type, returns the passed file name.
     """
     if raw_filename.startswith("WATCHLIST"):
-        filename_components = raw_filename.split("_")
-        return "_".join([filename_components[0], filename_components[2], filename_components[3]])
+        file_type, _, source_and_date = raw_filename.split("_", 2)
+        return f"{file_type}_{source_and_date}"
     return raw_filename
 
 
+@functools.lru_cache(maxsize=65536)
 def parse_source_from_name(file_name: str) -> str:
     """Parses the source id from a DataVault file name.
 
@@ -65,9 +83,7 @@ def parse_source_from_name(file_name: str) -> str:
     str
         The source id parsed from file_name
     """
-    #  if not re.match(r"^[A-Z]+_[0-9]{3,4}_[0-9]{8}\.txt\.bz2$", file_name):
-    #  raise Exception
-    return file_name.split("_")[1]
+    return file_name.split("_", 2)[1]
 
 
 def parse_reference_date(file_name: str) -> datetime.datetime:
@@ -90,7 +106,7 @@ def parse_reference_date(file_name: str) -> datetime.datetime:
         corresponding to the date in which the data was originally generated by the
         market source.
     """
-    return datetime.datetime.strptime(file_name.split("_")[2].split(".")[0], "%Y%m%d")
+    return datetime.datetime.strptime(file_name.split("_", 2)[2].split(".", 1)[0], "%Y%m%d")
 
 
 def create_discovered_file_object(file_node: Dict) -> DiscoveredFileInfo:
@@ -115,16 +131,57 @@ def create_discovered_file_object(file_node: Dict) -> DiscoveredFileInfo:
         A named tuple that organises the file information retrieved through the API call.
 
     """
+    file_name = clean_raw_filename(file_node["name"])
     return DiscoveredFileInfo(
-        file_name=clean_raw_filename(file_node["name"]),
+        file_name=file_name,
         download_url=create_node_url(file_node["url"]),
-        source_id=int(parse_source_from_name(clean_raw_filename(file_node["name"]))),
-        reference_date=parse_reference_date(clean_raw_filename(file_node["name"])),
+        source_id=int(parse_source_from_name(file_name)),
+        reference_date=parse_reference_date(file_name),
         size=file_node["size"],
         md5sum=file_node["md5sum"],
     )
 
 
+def belongs_to_source(file_node: DataVaultNode, source_id: int) -> bool:
+    """Checks whether a leaf node of the DataVault API belongs to a specific source.
+
+    Parameters
+    ----------
+    file_node: DataVaultNode
+        The dictionary describing a file, as returned by the DataVault API.
+    source_id: int
+        The source id to match.
+
+    Returns
+    -------
+    bool
+        True if the file originates from the passed source, False otherwise.
+    """
+    file_name = cast(str, file_node["name"])
+    return int(parse_source_from_name(clean_raw_filename(file_name))) == source_id
+
+
+def is_file_of_interest(node: DataVaultNode, source_id: Optional[int] = None) -> bool:
+    """Checks whether a node of the DataVault API is a file that should be collected.
+
+    Parameters
+    ----------
+    node: DataVaultNode
+        The dictionary describing a node, as returned by the DataVault API.
+    source_id: Optional[int]
+        The source id to match. If omitted, files from every source are of interest.
+
+    Returns
+    -------
+    bool
+        True if the node is a file and, when a source id is passed, it originates from
+        that source, False otherwise.
+    """
+    if node["directory"] is True:
+        return False
+    return not source_id or belongs_to_source(node, source_id)
+
+
 def initialise_search(
     url: str,
     credentials: Tuple[str, str],
@@ -156,25 +213,18 @@ def initialise_search(
         while the stack list will be populated with the information of the child nodes
         of the passed url.
     """
-    stack = []
-    leaf_nodes = []
+    if source_id:
+        source_id = int(source_id)
     with session.get(url, auth=credentials) as initial_response:
         # if initial_response.status_code == 200:
         initial_response.raise_for_status()
-        for neighbour in initial_response.json():
-            if neighbour["directory"] is True:
-                stack.append(neighbour)
-            else:
-                if not source_id:
-                    leaf_nodes.append(create_discovered_file_object(neighbour))
-                else:
-                    if (
-                        int(
-                            parse_source_from_name(
-                            clean_raw_filename(neighbour["name"])),
-                        ) == int(source_id)
-                    ):
-                        leaf_nodes.append(create_discovered_file_object(neighbour))
+        neighbours = json_loads(initial_response.content)
+    stack = [neighbour for neighbour in neighbours if neighbour["directory"] is True]
+    leaf_nodes = [
+        create_discovered_file_object(neighbour)
+        for neighbour in neighbours
+        if is_file_of_interest(neighbour, source_id)
+    ]
     return stack, leaf_nodes
 
 
@@ -192,10 +242,43 @@ def create_node_url(url_path: str) -> str:
         The full node url obtained by combining the url path with the other components
         of the url.
     """
-    return urllib.parse.urljoin(
-        "https://api.icedatavault.icedataservices.com",
-        url_path,
-    )
+    if url_path.startswith("/"):
+        return f"{DATAVAULT_API_URL}{url_path}"
+    return f"{DATAVAULT_API_URL}/{url_path}"
+
+
+def get_node_neighbours(
+    url_path: str,
+    credentials: Tuple[str, str],
+    session: Optional[requests.Session] = None,
+) -> List[DataVaultNode]:
+    """Queries a directory node of the DataVault API and returns its child nodes.
+
+    The function is designed to be executed concurrently by multiple threads, and for
+    this reason, unless a session is passed, it relies on a thread-specific session
+    object.
+
+    Parameters
+    ----------
+    url_path: str
+        The url path pointing to the location of the node within the API directory tree.
+    credentials: Tuple[str, str]
+        A tuple containing the username and password used to access the DataVault API.
+    session: Optional[requests.Session]
+        The session used to query the node. It must not be shared with other threads. If
+        omitted, the thread-specific session returned by thread_get_session is used.
+
+    Returns
+    -------
+    List[DataVaultNode]
+        A list of dictionaries, each containing the details of a child node as returned
+        by the DataVault API.
+    """
+    if session is None:
+        session = thread_get_session()
+    with session.get(create_node_url(url_path), auth=credentials) as response:
+        response.raise_for_status()
+        return json_loads(response.content)
 
 
 def traverse_api_directory_tree(
@@ -204,13 +287,21 @@ def traverse_api_directory_tree(
     stack: List,
     leaf_nodes: List[DiscoveredFileInfo],
     source_id: Optional[int] = None,
+    max_number_of_workers: int = 16,
 ) -> List[DiscoveredFileInfo]:
     """Transverses the DataVault API directory tree and returns the discovered files.
 
+    The directory tree is traversed one level at a time: all the directory nodes that
+    belong to the same level of the tree are queried concurrently, and the directories
+    discovered among their child nodes form the next level to visit.
+
     Parameters
     ----------
     session: requests.Session
-        A session object.
+        A session object. It is used to query the nodes only when max_number_of_workers
+        is 1. A session is not safe to share across threads, so with more workers each
+        thread queries the API through its own thread-specific session, created by
+        create_session, and the settings of the passed session are not applied.
     credentials: Tuple[str, str]
         A tuple containing the username and password used to access the DataVault API.
     stack: List
@@ -224,6 +315,9 @@ def traverse_api_directory_tree(
         of DiscoveredFileInfo named-tuples. If not specified, all the discovered files are
         returned. If source_id is, instead, specified, only the files that belong to the
         specified source are included in the list.
+    max_number_of_workers: int
+        The maximum number of threads used to query the nodes of a level of the directory
+        tree concurrently. By default is set to 16.
 
     Returns
     -------
@@ -231,39 +325,47 @@ def traverse_api_directory_tree(
         A list of DiscoveredFileInfo named-tuples with the details of the files discovered
         while traversing the directory tree of the DataVault API.
     """
-    visited_nodes = []
-    while len(stack) != 0:
-        node_to_visit = stack.pop()
-        if node_to_visit not in visited_nodes:
-            visited_nodes.append(node_to_visit)
-            url_to_query = create_node_url(node_to_visit["url"])
-            with session.get(url_to_query, auth=credentials) as response:
-                # if response.status_code == 200:
-                response.raise_for_status()
-                discovered_neighbours = response.json()
-                for neighbour in discovered_neighbours:
-                    if neighbour["directory"] is True:
-                        stack.append(neighbour)
-                    else:
-                        if not source_id:
-                            leaf_nodes.append(
-                                create_discovered_file_object(neighbour),
-                            )
-                        else:
-                            if (
-                                int(
-                                    parse_source_from_name(
-                                    clean_raw_filename(neighbour["name"])),
-                                ) == int(source_id)
-                            ):
-                                leaf_nodes.append(
-                                    create_discovered_file_object(neighbour),
-                                )
+    if source_id:
+        source_id = int(source_id)
+    visited_urls = set()
+    current_level = stack
+    worker_session = session if max_number_of_workers == 1 else None
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_number_of_workers) as executor:
+        while current_level:
+            urls_to_visit = []
+            for node in current_level:
+                if node["url"] not in visited_urls:
+                    visited_urls.add(node["url"])
+                    urls_to_visit.append(node["url"])
+            next_level = []
+            for discovered_neighbours in executor.map(
+                get_node_neighbours,
+                urls_to_visit,
+                repeat(credentials),
+                repeat(worker_session),
+            ):
+                next_level.extend(
+                    [
+                        neighbour for neighbour in discovered_neighbours
+                        if neighbour["directory"] is True
+                    ],
+                )
+                leaf_nodes.extend(
+                    [
+                        create_discovered_file_object(neighbour)
+                        for neighbour in discovered_neighbours
+                        if is_file_of_interest(neighbour, source_id)
+                    ],
+                )
+            current_level = next_level
     return leaf_nodes
 
 
 def datavault_crawler(
-    url: str, credentials: Tuple[str, str], source_id: Optional[int] = None,
+    url: str,
+    credentials: Tuple[str, str],
+    source_id: Optional[int] = None,
+    max_number_of_workers: int = 16,
 ) -> List[DiscoveredFileInfo]:
     """Crawls the directory tree of the DataVault API to discover files available to download.
 
@@ -276,6 +378,9 @@ def datavault_crawler(
     source_id: Optional[str]
         An optional string that allows to specify a specific source id for which we
         want to discover the available files to download.
+    max_number_of_workers: int
+        The maximum number of threads used to query the nodes of a level of the directory
+        tree concurrently. By default is set to 16.
 
     Returns
     -------
@@ -285,4 +390,6 @@ def datavault_crawler(
     """
     session = create_session()
     stack, leaf_nodes = initialise_search(url, credentials, session, source_id)
-    return traverse_api_directory_tree(session, credentials, stack, leaf_nodes, source_id)
+    return traverse_api_directory_tree(
+        session, credentials, stack, leaf_nodes, source_id, max_number_of_workers,
+    )
@@ -1,12 +1,74 @@
 """Implements the functions checking for the integrity of the downloaded data."""
+import concurrent.futures
 import hashlib
+import mmap
+import os
 import pathlib
-from typing import List
+from typing import BinaryIO, Callable, List, Optional, Protocol, Union
 
 from datavault_api_client.data_structures import DownloadDetails
 
 
-def calculate_checksum(path_to_file: pathlib.Path, hash_constructor=hashlib.md5) -> str:
+CHECKSUM_BUFFER_SIZE = 1024 * 1024
+MAXIMUM_MEMORY_MAPPED_FILE_SIZE = 512 * 1024 * 1024
+
+
+class HashObject(Protocol):
+    """The part of the interface of the hashlib hash objects used to calculate checksums."""
+
+    def update(self, data: Union[bytes, memoryview, mmap.mmap]) -> None:
+        """Updates the hash object with the passed bytes."""
+
+    def hexdigest(self) -> str:
+        """Returns the digest of the data passed so far as hexadecimal digits."""
+
+
+def calculate_file_object_checksum(
+    file: BinaryIO,
+    hash_constructor: Callable[[], HashObject] = hashlib.md5,
+) -> str:
+    """Calculates the checksum of a file opened in binary mode, given a specific hash algorithm.
+
+    Files that are not empty and not larger than MAXIMUM_MEMORY_MAPPED_FILE_SIZE bytes are
+    memory-mapped and hashed with a single update call. Larger files are hashed by
+    hashlib.file_digest on Python 3.11 and above, otherwise they are read in chunks of
+    CHECKSUM_BUFFER_SIZE bytes into a single reusable buffer.
+
+    Parameters
+    ----------
+    file: BinaryIO
+        A file object opened in binary mode and positioned at the start of the file.
+    hash_constructor:
+        An hashlib hash constructor indicating the hash algorithm to be used for
+        calculating the checksum.
+
+    Returns
+    -------
+    str
+        The file checksum of the file as a string containing only hexadecimal digits.
+    """
+    if 0 < os.fstat(file.fileno()).st_size <= MAXIMUM_MEMORY_MAPPED_FILE_SIZE:
+        file_hash = hash_constructor()
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+            file_hash.update(mapped_file)
+        return file_hash.hexdigest()
+    # The binary files opened by the package provide readinto, which BinaryIO does not
+    # declare, and hashlib.file_digest types the hash constructor more narrowly.
+    if hasattr(hashlib, "file_digest"):
+        file_hash = hashlib.file_digest(file, hash_constructor)  # type: ignore[arg-type]
+        return file_hash.hexdigest()
+    file_hash = hash_constructor()
+    buffer = memoryview(bytearray(CHECKSUM_BUFFER_SIZE))
+    readinto = file.readinto  # type: ignore[attr-defined]
+    for number_of_bytes_read in iter(lambda: readinto(buffer), 0):
+        file_hash.update(buffer[:number_of_bytes_read])
+    return file_hash.hexdigest()
+
+
+def calculate_checksum(
+    path_to_file: pathlib.Path,
+    hash_constructor: Callable[[], HashObject] = hashlib.md5,
+) -> str:
     """Calculates the checksum of a file, given a specific hash algorithm.
 
     Parameters
@@ -31,12 +93,8 @@ def calculate_checksum(path_to_file: pathlib.Path, hash_constructor=hashlib.md5)
     To get the sha512 digest of a file:
     >>> sha512_digest = calculate_checksum(path_to_file, hash_constructor=hashlib.sha512)
     """
-    file_hash = hash_constructor()
-    optimal_chunk_size = file_hash.block_size * 128
     with path_to_file.open(mode="rb") as file:
-        for chunk in iter(lambda: file.read(optimal_chunk_size), b""):
-            file_hash.update(chunk)
-    return file_hash.hexdigest()
+        return calculate_file_object_checksum(file, hash_constructor)
 
 
 def check_size(path_to_file: pathlib.Path) -> int:
@@ -59,6 +117,9 @@ def check_size(path_to_file: pathlib.Path) -> int:
 def data_integrity_test(file_download_details: DownloadDetails) -> bool:
     """Checks if the checksum digest and size of the downloaded file match the expected values.
 
+    The file is opened only once: the size is read from the open file first, so that
+    the checksum is only calculated for those files that have the expected size.
+
     Parameters
     ----------
     file_download_details: DownloadDetails
@@ -70,26 +131,31 @@ def data_integrity_test(file_download_details: DownloadDetails) -> bool:
     bool
         True if the downloaded file passes the test, False otherwise.
     """
-    test_results = (
-        check_size(file_download_details.file_path) == file_download_details.size,
-        calculate_checksum(file_download_details.file_path) == file_download_details.md5sum,
-    )
-    if all(test_results) is True:
-        return True
-    return False
+    with file_download_details.file_path.open(mode="rb") as file:
+        if os.fstat(file.fileno()).st_size != file_download_details.size:
+            return False
+        return calculate_file_object_checksum(file) == file_download_details.md5sum
 
 
 def get_list_of_failed_downloads(
     downloaded_files_info: List[DownloadDetails],
+    max_number_of_workers: Optional[int] = None,
 ) -> List[DownloadDetails]:
     """Tests the integrity of a list of files and collects those files that failed the test.
 
+    The files are tested concurrently, since the hash functions release the GIL while
+    digesting the content of a file. Each file is opened only once, and its checksum is
+    only calculated if it has the expected size.
+
     Parameters
     ----------
     downloaded_files_info: List[DownloadDetails]
         A list of DownloadDetails named-tuples containing, for each file, the file name,
         the download URL, the file path, the file size, the md5sum and the is_partitioned
         flag.
+    max_number_of_workers: Optional[int]
+        The maximum number of threads used to test the files. If omitted, the number of
+        threads is chosen by the executor.
 
     Returns
     -------
@@ -98,4 +164,8 @@ def get_list_of_failed_downloads(
         integrity test.
 
     """
-    return [file for file in downloaded_files_info if data_integrity_test(file) is False]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_number_of_workers) as executor:
+        test_outcomes = list(executor.map(data_integrity_test, downloaded_files_info))
+    return [
+        file for file, outcome in zip(downloaded_files_info, test_outcomes) if outcome is False
+    ]
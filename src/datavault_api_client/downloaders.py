@@ -4,52 +4,17 @@ import concurrent.futures
 import itertools
 from itertools import repeat
 import pathlib
-import threading
 from typing import List, Tuple
 
 import click
 import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util import Retry
 
-from datavault_api_client.connectivity import create_session
+from datavault_api_client.connectivity import create_session, thread_get_session
 from datavault_api_client.data_integrity import get_list_of_failed_downloads
 from datavault_api_client.data_structures import ConcurrentDownloadManifest, DownloadDetails
 from datavault_api_client.post_download_processing import post_concurrent_download_processing
 
 
-thread_local = threading.local()
-
-
-def thread_get_session() -> requests.Session:
-    """Creates a thread-specific session object.
-
-    The thread-specific session object is required to ensure thread safety when using
-    requests.Session(). When calling thread_get_session(), a session will be allocated
-    exclusively to the thread that originally invoked the function. Once the session
-    object is created, it will be reused by the thread on each subsequent call throughout
-    its entire lifetime.
-
-    Returns
-    -------
-    requests.Session
-        A requests.Session object.
-    """
-    if not hasattr(thread_local, "session"):
-        thread_local.session = requests.Session()
-        thread_local.session.mount(
-            "https://",
-            HTTPAdapter(
-                max_retries=Retry(
-                    total=5,
-                    backoff_factor=0.1,
-                    status_forcelist=(401, 500, 502, 503, 504),
-                ),
-            ),
-        )
-    return thread_local.session
-
-
 def download_file(download_info: DownloadDetails, credentials: tuple, session: requests.Session):
     download_url = download_info.download_url
     file_path = download_info.file_path
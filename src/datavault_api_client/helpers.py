@@ -133,6 +133,5 @@ def calculate_total_download_size(discovered_files: List[DiscoveredFileInfo]) ->
     str
         The total download size in a human readable form.
     """
-    file_sizes = [discovered_file.size for discovered_file in discovered_files]
-    total_download_size = sum(file_sizes)
+    total_download_size = sum(discovered_file.size for discovered_file in discovered_files)
     return generate_human_readable_size(total_download_size)
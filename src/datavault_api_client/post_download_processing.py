@@ -32,13 +32,17 @@ sequential order. The newly concatenated files are then passed to the integrity
 functions and, if any file fails the integrity test, its partitions are added to the list
 of files and partitions whose download is to be repeated.
 """
+import concurrent.futures
 import copy
+import errno
 import itertools
+import os
 import pathlib
 import shutil
-from typing import Any, List, Optional
+import sys
+from typing import Any, BinaryIO, Dict, List, Optional
 
-from datavault_api_client.data_integrity import get_list_of_failed_downloads
+from datavault_api_client.data_integrity import data_integrity_test, get_list_of_failed_downloads
 from datavault_api_client.data_structures import (
     ConcurrentDownloadManifest,
     DownloadDetails,
@@ -46,6 +50,9 @@ from datavault_api_client.data_structures import (
 )
 
 
+PARTITION_COPY_BUFFER_SIZE = 16 * 1024 * 1024
+
+
 ##########################################################################################
 
 
@@ -122,6 +129,70 @@ def get_partitions_download_details(
     ]
 
 
+def group_partitions_by_parent_file(
+    partitions_to_download: List[PartitionDownloadDetails],
+) -> Dict[str, List[PartitionDownloadDetails]]:
+    """Groups the PartitionDownloadDetails named-tuples by the name of their parent file.
+
+    Parameters
+    ----------
+    partitions_to_download: List[PartitionDownloadDetails]
+        A list of PartitionDownloadDetails named-tuples.
+
+    Returns
+    -------
+    Dict[str, List[PartitionDownloadDetails]]
+        A dictionary mapping the name of each partitioned file to the list of
+        PartitionDownloadDetails named-tuples of its partitions, in the order in which
+        they appear in partitions_to_download.
+    """
+    partitions_by_parent_file: Dict[str, List[PartitionDownloadDetails]] = {}
+    for partition in partitions_to_download:
+        partitions_by_parent_file.setdefault(partition.parent_file_name, []).append(partition)
+    return partitions_by_parent_file
+
+
+def get_partition_index(partition_file_name: str) -> int:
+    """Parses the partition index from the name of a partition file.
+
+    Partition files are named '<FILE-TYPE>_<SOURCE-ID>_<DATE>_<PARTITION-INDEX>.txt'.
+
+    Parameters
+    ----------
+    partition_file_name: str
+        The name of a partition file.
+
+    Returns
+    -------
+    int
+        The index of the partition.
+    """
+    return int(
+        partition_file_name[partition_file_name.rindex("_") + 1:partition_file_name.index(".")],
+    )
+
+
+def get_partition_file_names(path_to_folder: pathlib.Path) -> List[str]:
+    """Lists the names of the partition files in a folder, in no particular order.
+
+    Parameters
+    ----------
+    path_to_folder: pathlib.Path
+        A pathlib.Path indicating the full path to the directory where we want to check
+        for partition files.
+
+    Returns
+    -------
+    List[str]
+        The names of the partition files found in the directory. If the directory does not
+        exist or no partition file is found, the function will return an empty list.
+    """
+    if not path_to_folder.is_dir():
+        return []
+    with os.scandir(path_to_folder) as folder_entries:
+        return [entry.name for entry in folder_entries if entry.name.endswith(".txt")]
+
+
 def get_downloaded_partitions(path_to_folder: pathlib.Path) -> List[Any]:
     """Retrieves the full paths of the partitions file in a folder.
 
@@ -139,10 +210,9 @@ def get_downloaded_partitions(path_to_folder: pathlib.Path) -> List[Any]:
         path to an individual partition file. If no partition file is found in the
         directory, the function will return an empty list.
     """
-    downloaded_partitions = list(path_to_folder.glob("*.txt"))
-    if len(downloaded_partitions) != 0:
-        downloaded_partitions.sort(key=lambda x: int(x.stem.split("_")[3]))
-    return downloaded_partitions
+    partition_file_names = get_partition_file_names(path_to_folder)
+    partition_file_names.sort(key=get_partition_index)
+    return [path_to_folder / file_name for file_name in partition_file_names]
 
 
 def get_file_specific_missing_partitions(
@@ -166,21 +236,21 @@ def get_file_specific_missing_partitions(
         instead, no missing partition is found, the function will return an empty
         list.
     """
-    expected_partitions = get_partitions_download_details(
-        partitions_to_download,
-        file_name=file_specific_download_details.file_name,
-    )
+    path_to_folder = file_specific_download_details.file_path.parent
+    downloaded_partitions = {
+        path_to_folder / file_name for file_name in get_partition_file_names(path_to_folder)
+    }
     return [
-        partition for partition in expected_partitions
-        if partition.file_path not in get_downloaded_partitions(
-            file_specific_download_details.file_path.parent,
-        )
+        partition for partition in partitions_to_download
+        if partition.parent_file_name == file_specific_download_details.file_name
+        if partition.file_path not in downloaded_partitions
     ]
 
 
 def get_all_missing_partitions(
     whole_files_reference_data: List[DownloadDetails],
     partitions_to_download: List[PartitionDownloadDetails],
+    partitioned_files: Optional[List[DownloadDetails]] = None,
 ) -> List[PartitionDownloadDetails]:
     """Returns all the missing partitions from a download session.
 
@@ -191,6 +261,9 @@ def get_all_missing_partitions(
         information.
     partitions_to_download: List[PartitionDownloadDetails]
         A list of PartitionDownloadDetails named-tuples.
+    partitioned_files: Optional[List[DownloadDetails]]
+        The partitioned files of whole_files_reference_data, if the caller has already
+        filtered them. If omitted, they are filtered from whole_files_reference_data.
 
     Returns
     -------
@@ -201,12 +274,17 @@ def get_all_missing_partitions(
         the download information of the missing partitions. If no missing partition is found,
         the function will return a tuple of empty lists.
     """
-    missing_partitions = [
-        get_file_specific_missing_partitions(file, partitions_to_download)
-        for file in get_partitioned_files(whole_files_reference_data)
-        if len(get_file_specific_missing_partitions(file, partitions_to_download)) > 0
-    ]
-    return list(itertools.chain.from_iterable(missing_partitions))
+    if partitioned_files is None:
+        partitioned_files = get_partitioned_files(whole_files_reference_data)
+    if not partitioned_files:
+        return []
+    partitions_by_parent_file = group_partitions_by_parent_file(partitions_to_download)
+    missing_partitions = []
+    for file in partitioned_files:
+        missing_partitions.extend(get_file_specific_missing_partitions(
+            file, partitions_by_parent_file.get(file.file_name, []),
+        ))
+    return missing_partitions
 
 
 def get_files_with_missing_partitions(
@@ -239,6 +317,7 @@ def get_files_with_missing_partitions(
 def get_files_ready_for_concatenation(
     whole_files_reference_data: List[DownloadDetails],
     files_with_missing_partitions: List[DownloadDetails],
+    partitioned_files: Optional[List[DownloadDetails]] = None,
 ) -> List[DownloadDetails]:
     """Returns a list of files that are not missing any partition and are ready for concatenation.
 
@@ -251,6 +330,9 @@ def get_files_ready_for_concatenation(
         A list of DownloadDetails named-tuples each containing file-specific download
         information for all those files that are missing some partitions after the
         download.
+    partitioned_files: Optional[List[DownloadDetails]]
+        The partitioned files of whole_files_reference_data, if the caller has already
+        filtered them. If omitted, they are filtered from whole_files_reference_data.
 
     Returns
     -------
@@ -260,16 +342,86 @@ def get_files_ready_for_concatenation(
         download and that therefore are ready to have their partitions concatenated in
         a single file.
     """
-    return list(
-        set(get_partitioned_files(whole_files_reference_data)).difference(
-            files_with_missing_partitions,
-        ),
-    )
+    if partitioned_files is None:
+        partitioned_files = get_partitioned_files(whole_files_reference_data)
+    names_of_files_with_missing_partitions = {
+        file.file_name for file in files_with_missing_partitions
+    }
+    return [
+        file for file in partitioned_files
+        if file.file_name not in names_of_files_with_missing_partitions
+    ]
+
+
+def append_file_content(source: BinaryIO, destination: BinaryIO) -> None:
+    """Appends the whole content of a file to another file.
+
+    On Linux the content is copied by the kernel with os.sendfile, without passing through
+    a user space buffer. On the other platforms, or if the file system does not support
+    os.sendfile, the content is copied with shutil.copyfileobj.
+
+    Parameters
+    ----------
+    source: BinaryIO
+        The file, opened in binary read mode, whose content is to be copied.
+    destination: BinaryIO
+        The file, opened in binary write mode, the content is appended to.
+    """
+    if sys.platform.startswith("linux"):
+        destination.flush()
+        source_size = os.fstat(source.fileno()).st_size
+        offset = 0
+        try:
+            while offset < source_size:
+                bytes_sent = os.sendfile(
+                    destination.fileno(), source.fileno(), offset, source_size - offset,
+                )
+                if bytes_sent == 0:
+                    break
+                offset += bytes_sent
+            return
+        except OSError:
+            source.seek(offset)
+    shutil.copyfileobj(source, destination, length=PARTITION_COPY_BUFFER_SIZE)
+
+
+def preallocate_file(file: BinaryIO, size_in_bytes: int) -> None:
+    """Reserves the disk space for a file that is about to be written.
+
+    The space is reserved with os.posix_fallocate, so that the file system can allocate
+    the file in a single operation rather than growing it while it is written. On the
+    platforms or file systems that do not support it, the function does nothing. Any
+    other error, such as a full disk, is raised straight away.
+
+    Parameters
+    ----------
+    file: BinaryIO
+        The file, opened in binary write mode, for which the space is reserved.
+    size_in_bytes: int
+        The final size of the file in bytes.
+
+    Raises
+    ------
+    OSError
+        If the space cannot be reserved for reasons other than the lack of support for
+        preallocation.
+    """
+    if size_in_bytes > 0 and hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(file.fileno(), 0, size_in_bytes)
+        except OSError as error:
+            if error.errno not in (errno.EOPNOTSUPP, errno.ENOSYS, errno.EINVAL):
+                raise
 
 
 def concatenate_partitions(path_to_output_file: pathlib.Path) -> str:
     """Concatenates .txt partition files into a single .txt.bz2 compressed file.
 
+    Where supported, the space for the output file is reserved before the partitions are
+    copied. The partition files are opened unbuffered, since their content is copied
+    straight from their file descriptors, and are deleted once all of them have been
+    copied.
+
     Parameters
     ----------
     path_to_output_file: pathlib.Path
@@ -284,27 +436,83 @@ def concatenate_partitions(path_to_output_file: pathlib.Path) -> str:
     available_partition_files = get_downloaded_partitions(path_to_output_file.parent)
     if len(available_partition_files) != 0:
         with path_to_output_file.open("wb") as outfile:
+            preallocate_file(
+                outfile,
+                sum(file_path.stat().st_size for file_path in available_partition_files),
+            )
             for file_path in available_partition_files:
-                with file_path.open("rb") as file_source:
-                    shutil.copyfileobj(file_source, outfile, length=(5 * 1024 * 1024))
-                file_path.unlink()
+                with open(file_path, "rb", buffering=0) as file_source:
+                    append_file_content(file_source, outfile)
+        for file_path in available_partition_files:
+            os.unlink(file_path)
     return path_to_output_file.as_posix()
 
 
+def concatenate_file_partitions(file_download_details: DownloadDetails) -> bool:
+    """Concatenates the partition files of a file, unless the file was already concatenated.
+
+    If a previous run was interrupted after a file was concatenated but before its
+    partitions were deleted, the file is found already complete: in this case the file is
+    not rebuilt and only the leftover partitions are deleted. Since the output file is
+    preallocated, its size alone does not prove that it is complete, hence the file is
+    required to pass the data integrity test.
+
+    Parameters
+    ----------
+    file_download_details: DownloadDetails
+        A DownloadDetails named-tuple containing the download information of a file that
+        does not have any missing partition.
+
+    Returns
+    -------
+    bool
+        True if the partitions were concatenated and the output file has yet to be tested
+        for data integrity, False if the file was found already complete and has therefore
+        already passed the test.
+    """
+    path_to_output_file = file_download_details.file_path
+    if path_to_output_file.is_file() and data_integrity_test(file_download_details):
+        for file_path in get_downloaded_partitions(path_to_output_file.parent):
+            file_path.unlink()
+        return False
+    concatenate_partitions(path_to_output_file)
+    return True
+
+
 def concatenate_each_file_partitions(
     files_to_concatenate: List[DownloadDetails],
+    max_number_of_workers: int = 8,
 ) -> List[DownloadDetails]:
     """Concatenates the partition files of all the files with partitions to concatenate.
 
+    The partitions of each file are stored in a folder of their own, so the files are
+    concatenated concurrently. The files that are found already concatenated are not
+    rebuilt, and since they already passed the data integrity test they are left out of
+    the returned list, so that they are not hashed a second time.
+
     Parameters
     ----------
     files_to_concatenate: List[DownloadDetails]
         A list of DownloadDetails named-tuples containing the download information of all
         those files that do not have any missing partition.
+    max_number_of_workers: int
+        The maximum number of files that are concatenated at the same time. By default
+        is set to 8.
+
+    Returns
+    -------
+    List[DownloadDetails]
+        A list of DownloadDetails named-tuples of the files whose partitions were
+        concatenated, and that have yet to be tested for data integrity.
     """
-    for file in files_to_concatenate:
-        concatenate_partitions(file.file_path)
-    return files_to_concatenate
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_number_of_workers) as executor:
+        concatenation_outcomes = list(
+            executor.map(concatenate_file_partitions, files_to_concatenate),
+        )
+    return [
+        file for file, was_concatenated in zip(files_to_concatenate, concatenation_outcomes)
+        if was_concatenated is True
+    ]
 
 
 def get_files_ready_for_integrity_test(
@@ -333,13 +541,20 @@ def get_files_ready_for_integrity_test(
         A list of DownloadDetails named-tuples containing the information of those files
         that are ready for the data integrity checks.
     """
-    return list(set(whole_files_reference_data).difference(set(files_with_missing_partitions)))
+    names_of_files_with_missing_partitions = {
+        file.file_name for file in files_with_missing_partitions
+    }
+    return [
+        file for file in whole_files_reference_data
+        if file.file_name not in names_of_files_with_missing_partitions
+    ]
 
 ##########################################################################################
 
 
 def pre_concatenation_processing(
     download_manifest: ConcurrentDownloadManifest,
+    partitioned_files: Optional[List[DownloadDetails]] = None,
 ) -> ConcurrentDownloadManifest:
     """Implements the pre-concatenation processing phase.
 
@@ -358,6 +573,9 @@ def pre_concatenation_processing(
     download_manifest: ConcurrentDownloadManifest
         A ConcurrentDownloadManifest named-tuple containing the download manifest that
         was originally used to download the files concurrently.
+    partitioned_files: Optional[List[DownloadDetails]]
+        The partitioned files of the download manifest, if the caller has already
+        filtered them. If omitted, they are filtered from the download manifest.
 
     Returns
     -------
@@ -372,6 +590,7 @@ def pre_concatenation_processing(
     missing_partitions = get_all_missing_partitions(
         whole_files_reference_data=download_manifest.files_reference_data,
         partitions_to_download=download_manifest.partitions_to_download,
+        partitioned_files=partitioned_files,
     )
     files_with_missing_partitions = get_files_with_missing_partitions(
         whole_files_reference_data=download_manifest.files_reference_data,
@@ -390,6 +609,7 @@ def pre_concatenation_processing(
 def concatenation_processing(
     download_manifest: ConcurrentDownloadManifest,
     failed_downloads_manifest: ConcurrentDownloadManifest,
+    partitioned_files: Optional[List[DownloadDetails]] = None,
 ) -> List[DownloadDetails]:
     """Implements the concatenation processing phase.
 
@@ -408,20 +628,23 @@ def concatenation_processing(
         whole that failed the data integrity test, and of the files that were split in
         multiple partitions but that, after the initial download, were found missing one
         or more partitions.
+    partitioned_files: Optional[List[DownloadDetails]]
+        The partitioned files of the download manifest, if the caller has already
+        filtered them. If omitted, they are filtered from the download manifest.
 
     Returns
     -------
     List[DownloadDetails]
         A list containing the DownloadDetails named-tuples of all the files that went
-        through the concatenation process.
+        through the concatenation process. The files found already concatenated and
+        complete are not included.
     """
-    files_with_missing_partitions = [
-        file for file in failed_downloads_manifest.files_reference_data
-        if file.is_partitioned is True
-    ]
+    # The failed whole files are not partitioned, so they can be passed along with the files
+    # missing partitions without filtering them out first.
     files_ready_for_concatenation = get_files_ready_for_concatenation(
         whole_files_reference_data=download_manifest.files_reference_data,
-        files_with_missing_partitions=files_with_missing_partitions,
+        files_with_missing_partitions=failed_downloads_manifest.files_reference_data,
+        partitioned_files=partitioned_files,
     )
     return concatenate_each_file_partitions(files_ready_for_concatenation)
 
@@ -465,13 +688,12 @@ def update_failed_download_manifest(
             integrity_test_failing_files,
         ),
     )
+    partitions_by_parent_file = group_partitions_by_parent_file(
+        initial_download_manifest.partitions_to_download,
+    )
     failed_partitions = []
     for failed_file in integrity_test_failing_files:
-        file_specific_partitions = get_partitions_download_details(
-            initial_download_manifest.partitions_to_download,
-            failed_file.file_name,
-        )
-        failed_partitions.extend(file_specific_partitions)
+        failed_partitions.extend(partitions_by_parent_file.get(failed_file.file_name, []))
     updated_partitions_to_download = list(itertools.chain(
         partition_to_download_to_update,
         list(itertools.chain(failed_partitions)),
@@ -500,8 +722,12 @@ def post_concurrent_download_processing(
         The download manifest containing the information of the files that need to be
         downloaded once again.
     """
-    initial_failed_downloads = pre_concatenation_processing(download_manifest)
-    concatenated_files = concatenation_processing(download_manifest, initial_failed_downloads)
+    # Both phases need the partitioned files, so they are filtered only once.
+    partitioned_files = get_partitioned_files(download_manifest.files_reference_data)
+    initial_failed_downloads = pre_concatenation_processing(download_manifest, partitioned_files)
+    concatenated_files = concatenation_processing(
+        download_manifest, initial_failed_downloads, partitioned_files,
+    )
     integrity_test_failing_downloads = get_list_of_failed_downloads(concatenated_files)
     return update_failed_download_manifest(
         initial_failed_downloads,
@@ -5,11 +5,12 @@ DiscoveredFileInfo named tuples that is produced by the crawler, and prepare the
 manifest that is used by the downloading functions as a reference.
 """
 import datetime
+import functools
 import itertools
 import json
+import operator
 import pathlib
-from typing import Dict, List, Optional
-import urllib.parse
+from typing import Dict, List, Optional, Tuple
 
 from datavault_api_client.data_structures import (
     ConcurrentDownloadManifest,
@@ -20,6 +21,9 @@ from datavault_api_client.data_structures import (
 )
 
 
+BYTES_PER_MIB = 1024 * 1024
+
+
 def generate_file_path_matching_datavault_structure(
     path_to_data_folder: str,
     file_name: str,
@@ -48,14 +52,16 @@ def generate_file_path_matching_datavault_structure(
         A Path object that originates from the data folder specified by the user that
         respects the structure of the directory tree in the Datavault API.
     """
-    datavault_path = urllib.parse.urlsplit(datavault_download_url).path
-    relevant_path_components = datavault_path.split("/")[3:8]
-    directory_path = pathlib.Path(path_to_data_folder).joinpath(
-        "/".join(relevant_path_components),
-    )
-    return directory_path.joinpath(file_name)
+    # The URL is structured as <scheme>://<host>/v2/data/<year>/<month>/<day>/<source>/...
+    # hence, once the scheme is dropped, the relevant components follow the first three.
+    _, scheme_separator, host_and_path = datavault_download_url.partition("://")
+    if not scheme_separator:
+        host_and_path = datavault_download_url
+    relevant_path = "/".join(host_and_path.split("/", 8)[3:8])
+    return pathlib.Path(path_to_data_folder, relevant_path, file_name)
 
 
+@functools.lru_cache(maxsize=32)
 def convert_mib_to_bytes(size_in_mib: float) -> int:
     """Converts a size expressed in MiB to Bytes.
 
@@ -69,9 +75,10 @@ def convert_mib_to_bytes(size_in_mib: float) -> int:
     int
         The size in Bytes equivalent to the passed size in MiB.
     """
-    return round(size_in_mib * (1024**2))
+    return round(size_in_mib * BYTES_PER_MIB)
 
 
+@functools.lru_cache(maxsize=32)
 def calculate_multi_part_threshold(partition_size_in_mib: float) -> int:
     """Calculates the file size above which a file is to be split in same size partitions.
 
@@ -91,11 +98,8 @@ def calculate_multi_part_threshold(partition_size_in_mib: float) -> int:
     int
         The multi-part threshold in Bytes.
     """
-    return round(
-        (convert_mib_to_bytes(partition_size_in_mib) * 2) + (0.8 * convert_mib_to_bytes(
-            partition_size_in_mib,
-        )),
-    )
+    partition_size_in_bytes = convert_mib_to_bytes(partition_size_in_mib)
+    return round(2.8 * partition_size_in_bytes)
 
 
 def check_if_partitioned(file_size_in_bytes: int, partition_size_in_mib: float) -> bool:
@@ -113,9 +117,7 @@ def check_if_partitioned(file_size_in_bytes: int, partition_size_in_mib: float)
     bool
         True if the file size is larger than the multi-part threshold, False otherwise.
     """
-    if file_size_in_bytes >= calculate_multi_part_threshold(partition_size_in_mib):
-        return True
-    return False
+    return file_size_in_bytes >= calculate_multi_part_threshold(partition_size_in_mib)
 
 
 def process_raw_download_info(
@@ -151,21 +153,6 @@ def process_raw_download_info(
         path where the file will be downloaded, the file size, the md5sum digest, and a
         flag that informs whether the file is eligible to be split in multiple partitions.
     """
-    if not partition_size_in_mib:
-        return DownloadDetails(
-            file_name=raw_download_info.file_name,
-            download_url=raw_download_info.download_url,
-            file_path=generate_file_path_matching_datavault_structure(
-                path_to_data_folder,
-                file_name=raw_download_info.file_name,
-                datavault_download_url=raw_download_info.download_url,
-            ),
-            source_id=raw_download_info.source_id,
-            reference_date=raw_download_info.reference_date,
-            size=raw_download_info.size,
-            md5sum=raw_download_info.md5sum,
-            is_partitioned=None,
-        )
     return DownloadDetails(
         file_name=raw_download_info.file_name,
         download_url=raw_download_info.download_url,
@@ -178,7 +165,10 @@ def process_raw_download_info(
         reference_date=raw_download_info.reference_date,
         size=raw_download_info.size,
         md5sum=raw_download_info.md5sum,
-        is_partitioned=check_if_partitioned(raw_download_info.size, partition_size_in_mib),
+        is_partitioned=(
+            raw_download_info.size >= calculate_multi_part_threshold(partition_size_in_mib)
+            if partition_size_in_mib else None
+        ),
     )
 
 
@@ -337,7 +327,7 @@ def update_manifest_file(
     for item in items_to_append:
         if item not in updated_manifest:
             updated_manifest.append(item)
-    updated_manifest.sort(key=lambda x: x.get("source_id"))
+    updated_manifest.sort(key=operator.itemgetter("source_id"))
     with pathlib.Path(path_to_download_manifest).open('w') as outfile:
         json.dump(updated_manifest, outfile, indent=2)
 
@@ -453,14 +443,15 @@ def calculate_list_of_partition_upper_extremities(
     List[int]
         A list of bytes indicating the upper extremities of each partition in a file.
     """
+    partition_size_in_bytes = convert_mib_to_bytes(partition_size_in_mib)
+    number_of_same_size_partitions, size_of_last_partition = divmod(
+        file_size_in_bytes, partition_size_in_bytes,
+    )
     list_of_upper_extremities = [
-        convert_mib_to_bytes(partition_size_in_mib) * i
-        for i in range(1, calculate_number_of_same_size_partitions(
-            file_size_in_bytes, partition_size_in_mib,
-        ) + 1)
+        partition_size_in_bytes * i for i in range(1, number_of_same_size_partitions + 1)
     ]
 
-    if calculate_size_of_last_partition(file_size_in_bytes, partition_size_in_mib) != 0:
+    if size_of_last_partition != 0:
         list_of_upper_extremities.append(file_size_in_bytes)
 
     return list_of_upper_extremities
@@ -503,7 +494,8 @@ def calculate_list_of_partition_extremities(
     """Calculates the extremities of each partition and collects them in a list of dictionaries.
 
     Each dictionary contains a 'start' and 'end' key indicating the position in bytes of
-    the starting and ending extremities of each partition.
+    the starting and ending extremities of each partition. The extremities are calculated
+    in a single pass over the partitions.
 
     Parameters
     ----------
@@ -518,17 +510,15 @@ def calculate_list_of_partition_extremities(
         A list of dictionaries containing the starting and ending extremities of each
         partition.
     """
-    return [
-        {"start": extremities[0], "end": extremities[1]}
-        for extremities in zip(
-            calculate_list_of_partition_lower_extremities(
-                file_size_in_bytes, partition_size_in_mib,
-            ),
-            calculate_list_of_partition_upper_extremities(
-                file_size_in_bytes, partition_size_in_mib,
-            ),
-        )
-    ]
+    partition_size_in_bytes = convert_mib_to_bytes(partition_size_in_mib)
+    list_of_partition_extremities = []
+    start = 0
+    for end in range(partition_size_in_bytes, file_size_in_bytes + 1, partition_size_in_bytes):
+        list_of_partition_extremities.append({"start": start, "end": end})
+        start = end + 1
+    if file_size_in_bytes % partition_size_in_bytes != 0:
+        list_of_partition_extremities.append({"start": start, "end": file_size_in_bytes})
+    return list_of_partition_extremities
 
 
 def format_query_string(parameters_to_encode: Dict[str, int]) -> str:
@@ -548,7 +538,8 @@ def format_query_string(parameters_to_encode: Dict[str, int]) -> str:
     str
         A query string.
     """
-    return urllib.parse.urlencode(parameters_to_encode)
+    # The keys are plain words and the values integers, so nothing needs to be quoted.
+    return "&".join(f"{key}={value}" for key, value in parameters_to_encode.items())
 
 
 def join_base_url_and_query_string(base_url: str, query_string: str) -> str:
@@ -571,6 +562,57 @@ def join_base_url_and_query_string(base_url: str, query_string: str) -> str:
     return f"{base_url}?{query_string}"
 
 
+def create_partition_download_url_prefix(whole_file_download_url: str) -> str:
+    """Creates the part of the download URL that is shared by all the partitions of a file.
+
+    Parameters
+    ----------
+    whole_file_download_url: str
+        The download URL that is used to download a specific file.
+
+    Returns
+    -------
+    str
+        The whole-file download URL, without any trailing slash, followed by the '?'
+        that opens the query string.
+    """
+    if whole_file_download_url.endswith("/"):
+        whole_file_download_url = whole_file_download_url[:-1]
+    return f"{whole_file_download_url}?"
+
+
+def format_partition_download_url(
+    download_url_prefix: str,
+    partition_extremities: Dict[str, int],
+) -> str:
+    """Appends the query string of a partition to the download URL prefix of its file.
+
+    The query string is formatted as:
+        start=<partition-lower-extremity>&end=<partition-upper-extremity>
+
+    The extremities are formatted directly rather than through format_query_string, since
+    this function runs once for every partition of every partitioned file.
+
+    Parameters
+    ----------
+    download_url_prefix: str
+        The download URL prefix of the file, as returned by
+        create_partition_download_url_prefix.
+    partition_extremities: Dict[str, int]
+        A dictionary containing the lower and upper extremities of the partition to
+        encode.
+
+    Returns
+    -------
+    str
+        The download URL for a specific partition.
+    """
+    return (
+        f"{download_url_prefix}start={partition_extremities['start']}"
+        f"&end={partition_extremities['end']}"
+    )
+
+
 def create_partition_download_url(
     whole_file_download_url: str,
     partition_extremities: Dict[str, int],
@@ -592,11 +634,59 @@ def create_partition_download_url(
     str
         The download URL for a specific partition.
     """
-    return join_base_url_and_query_string(
-        whole_file_download_url, format_query_string(partition_extremities),
+    return format_partition_download_url(
+        create_partition_download_url_prefix(whole_file_download_url), partition_extremities,
     )
 
 
+def get_partition_path_components(
+    path_to_whole_file: pathlib.Path,
+) -> Tuple[pathlib.Path, str, str]:
+    """Extracts the parts of the path to a whole file that are shared by its partitions.
+
+    Parameters
+    ----------
+    path_to_whole_file: pathlib.Path
+        The full path to the location where the whole file that is partitioned should be
+        saved.
+
+    Returns
+    -------
+    Tuple[pathlib.Path, str, str]
+        The folder of the whole file, the name of the whole file without any extension,
+        and the first extension of the whole file.
+    """
+    return (
+        path_to_whole_file.parent,
+        path_to_whole_file.stem.split(".")[0],
+        path_to_whole_file.suffixes[0],
+    )
+
+
+def format_path_to_file_partition(
+    partition_path_components: Tuple[pathlib.Path, str, str],
+    partition_number: int,
+) -> pathlib.Path:
+    """Creates a partition-specific path from the path components of the whole file.
+
+    Parameters
+    ----------
+    partition_path_components: Tuple[pathlib.Path, str, str]
+        The folder, name and extension of the whole file, as returned by
+        get_partition_path_components.
+    partition_number: int
+        The position of the partition relative to the body of the whole file, starting
+        from 1.
+
+    Returns
+    -------
+    pathlib.Path
+        The partition-specific full path.
+    """
+    path_to_folder, partition_name, partition_extension = partition_path_components
+    return path_to_folder.joinpath(f"{partition_name}_{partition_number}{partition_extension}")
+
+
 def generate_path_to_file_partition(
     path_to_whole_file: pathlib.Path,
     partition_index: int,
@@ -621,11 +711,8 @@ def generate_path_to_file_partition(
     pathlib.Path
         The partition-specific full path.
     """
-    return path_to_whole_file.parent.joinpath(
-        (
-            f"{path_to_whole_file.stem.split('.')[0]}_{(partition_index + 1)}"
-            f"{path_to_whole_file.suffixes[0]}"
-        ),
+    return format_path_to_file_partition(
+        get_partition_path_components(path_to_whole_file), partition_index + 1,
     )
 
 
@@ -660,20 +747,20 @@ def create_list_of_file_specific_partition_download_info(
         file_specific_download_info.size,
         partition_size_in_mib,
     )
+    download_url_prefix = create_partition_download_url_prefix(
+        file_specific_download_info.download_url,
+    )
+    partition_path_components = get_partition_path_components(
+        file_specific_download_info.file_path,
+    )
     return [
         PartitionDownloadDetails(
             parent_file_name=file_specific_download_info.file_name,
-            download_url=create_partition_download_url(
-                file_specific_download_info.download_url,
-                extremities,
-            ),
-            file_path=generate_path_to_file_partition(
-                file_specific_download_info.file_path,
-                partition_index,
-            ),
-            partition_index=partition_index+1,
+            download_url=format_partition_download_url(download_url_prefix, extremities),
+            file_path=format_path_to_file_partition(partition_path_components, partition_index),
+            partition_index=partition_index,
         )
-        for partition_index, extremities in enumerate(file_partitions)
+        for partition_index, extremities in enumerate(file_partitions, start=1)
     ]
 
 
@@ -749,14 +836,14 @@ def generate_partitions_download_manifest(
         A list of PartitionDownloadDetails named-tuples containing the download information
         of every partition that has to be downloaded.
     """
-    files_to_partition = [file for file in whole_files_download_info if file.is_partitioned is True]
-    files_specific_partitions = [
+    return list(itertools.chain.from_iterable(
         create_list_of_file_specific_partition_download_info(
             file_specific_info,
-            partition_size_in_mib)
-        for file_specific_info in files_to_partition
-    ]
-    return list(itertools.chain.from_iterable(files_specific_partitions))
+            partition_size_in_mib,
+        )
+        for file_specific_info in whole_files_download_info
+        if file_specific_info.is_partitioned is True
+    ))
 
 
 def pre_concurrent_download_processor(
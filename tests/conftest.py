@@ -1,4 +1,6 @@
 import datetime
+import hashlib
+import os
 from pathlib import Path
 
 import pytest
@@ -3480,3 +3482,36 @@ def mocked_concurrent_download_manifest():
         ]
     )
     return download_manifest
+
+
+@pytest.fixture
+def mocked_partitioned_file_on_disk(tmp_path):
+    """A file split in three partitions that are written to a temporary folder.
+
+    The fixture returns the DownloadDetails named-tuple of the file and the content that
+    the file is expected to have once its partitions are concatenated.
+    """
+    file_content = os.urandom(300)
+    path_to_output_file = tmp_path / 'CROSS' / 'CROSSREF_207_20200721.txt.bz2'
+    path_to_output_file.parent.mkdir(parents=True)
+    for partition_index in range(3):
+        path_to_partition = path_to_output_file.parent.joinpath(
+            f'CROSSREF_207_20200721_{partition_index + 1}.txt',
+        )
+        path_to_partition.write_bytes(
+            file_content[partition_index * 100:(partition_index + 1) * 100],
+        )
+    file_download_details = DownloadDetails(
+        file_name='CROSSREF_207_20200721.txt.bz2',
+        download_url=(
+            'https://api.icedatavault.icedataservices.com/v2/data/2020/07/21/S207/CROSS/'
+            '20200721-S207_CROSS_ALL_0_0'
+        ),
+        file_path=path_to_output_file,
+        source_id=207,
+        reference_date=datetime.datetime(year=2020, month=7, day=21),
+        size=len(file_content),
+        md5sum=hashlib.md5(file_content).hexdigest(),
+        is_partitioned=True,
+    )
+    return file_download_details, file_content
@@ -85,6 +85,44 @@ class TestCreateDiscoveredFileObject:
         # Cleanup - none
 
 
+class TestBelongsToSource:
+    @pytest.mark.parametrize(
+        "file_name, source_id, expected_outcome", [
+            ("WATCHLIST_username_945_20201130.txt.bz2", 945, True),
+            ("WATCHLIST_username_945_20201130.txt.bz2", 367, False),
+            ("CROSSREF_367_20201130.txt.bz2", 367, True),
+            ("CROSSREF_367_20201130.txt.bz2", 945, False),
+        ],
+    )
+    def test_source_matching(self, file_name, source_id, expected_outcome):
+        # Setup
+        file_node = {"name": file_name, "directory": False}
+        # Exercise
+        outcome = crawler.belongs_to_source(file_node, source_id)
+        # Verify
+        assert outcome is expected_outcome
+        # Cleanup - none
+
+
+class TestIsFileOfInterest:
+    @pytest.mark.parametrize(
+        "file_name, is_directory, source_id, expected_outcome", [
+            ("CROSSREF_367_20201130.txt.bz2", False, None, True),
+            ("CROSSREF_367_20201130.txt.bz2", False, 367, True),
+            ("CROSSREF_367_20201130.txt.bz2", False, 945, False),
+            ("S367", True, None, False),
+        ],
+    )
+    def test_file_selection(self, file_name, is_directory, source_id, expected_outcome):
+        # Setup
+        node = {"name": file_name, "directory": is_directory}
+        # Exercise
+        outcome = crawler.is_file_of_interest(node, source_id)
+        # Verify
+        assert outcome is expected_outcome
+        # Cleanup - none
+
+
 class TestInitializeSearch:
     def test_initialization_of_search_from_instrument_url(
         self,
@@ -237,6 +275,48 @@ class TestTraverseApiDirectoryTree:
         )
         # Cleanup - none
 
+    @pytest.mark.parametrize(
+        "max_number_of_workers, is_passed_session_used", [
+            (1, True),
+            (4, False),
+        ],
+    )
+    def test_session_used_to_query_the_nodes(
+        self,
+        monkeypatch,
+        mocked_datavault_api_single_source_single_day,
+        max_number_of_workers,
+        is_passed_session_used,
+    ):
+        # Setup
+        session = requests.Session()
+        url = "https://api.icedatavault.icedataservices.com/v2/list"
+        credentials = ("username", "password")
+        stack = session.get(url).json()
+        querying_sessions = []
+        session_get = requests.Session.get
+
+        def spied_session_get(self, *args, **kwargs):
+            querying_sessions.append(self)
+            return session_get(self, *args, **kwargs)
+
+        monkeypatch.setattr(requests.Session, "get", spied_session_get)
+        # Exercise
+        crawler.traverse_api_directory_tree(
+            session,
+            credentials,
+            stack,
+            [],
+            max_number_of_workers=max_number_of_workers,
+        )
+        # Verify
+        assert querying_sessions
+        assert all(
+            (querying_session is session) is is_passed_session_used
+            for querying_session in querying_sessions
+        )
+        # Cleanup - none
+
     def test_traversal_of_api_directory_tree_with_not_matching_source_id(
         self,
         mocked_datavault_api_single_source_single_day,
@@ -333,7 +413,7 @@ class TestTraverseApiDirectoryTree:
         leaf_nodes = []
         # Exercise
         # Verify
-        with pytest.raises(requests.exceptions.HTTPError):
+        with pytest.raises(requests.exceptions.RetryError):
             crawler.traverse_api_directory_tree(session, credentials, stack, leaf_nodes)
         # Cleanup - none
 
@@ -405,9 +485,10 @@ class TestDatavaultCrawl:
         credentials = ("username", "password")
         # Exercise
         discovered_files = crawler.datavault_crawler(url_to_crawl, credentials)
+        discovered_files.sort(key=lambda x: x.file_name)
         # Verify
         expected_files = mocked_files_available_to_download_single_source_single_day
-        expected_files.sort(key=lambda x: x.file_name, reverse=True)
+        expected_files.sort(key=lambda x: x.file_name)
         assert discovered_files == expected_files
         # Cleanup - none
 
@@ -34,6 +34,83 @@ class TestChecksum:
         # Cleanup - none
 
 
+class TestFileObjectChecksum:
+    @pytest.mark.parametrize(
+        'file_path, true_digest', [
+            (pathlib.Path(__file__).resolve().parent / 'static_data' / 'test_file_1.txt',
+             '6bde2aa6394fde37e21748bc0578113b'),
+            (pathlib.Path(__file__).resolve().parent / 'static_data' / 'test_file_2.txt.bz2',
+             hashlib.md5(
+                 (pathlib.Path(__file__).resolve().parent / 'static_data' / 'test_file_2.txt.bz2')
+                 .read_bytes()
+             ).hexdigest()),
+        ]
+    )
+    def test_correct_digest_calculation(self, file_path, true_digest):
+        # Setup - none
+        # Exercise
+        with file_path.open('rb') as file:
+            calculated_digest = data_integrity.calculate_file_object_checksum(file)
+        # Verify
+        assert calculated_digest == true_digest
+        # Cleanup - none
+
+    @pytest.mark.skipif(
+        not hasattr(hashlib, 'file_digest'), reason='hashlib.file_digest requires Python 3.11',
+    )
+    @pytest.mark.parametrize(
+        'file_name, hash_constructor', [
+            ('test_file_1.txt', hashlib.md5),
+            ('test_file_1.txt', hashlib.sha256),
+            ('test_file_2.txt.bz2', hashlib.md5),
+        ]
+    )
+    def test_file_digest_branch(self, monkeypatch, file_name, hash_constructor):
+        # Setup
+        file_path = pathlib.Path(__file__).resolve().parent / 'static_data' / file_name
+        monkeypatch.setattr(data_integrity, 'MAXIMUM_MEMORY_MAPPED_FILE_SIZE', 0)
+        file_digest_calls = []
+        file_digest = hashlib.file_digest
+
+        def spied_file_digest(file, digest):
+            file_digest_calls.append(digest)
+            return file_digest(file, digest)
+
+        monkeypatch.setattr(hashlib, 'file_digest', spied_file_digest)
+        # Exercise
+        with file_path.open('rb') as file:
+            calculated_digest = data_integrity.calculate_file_object_checksum(
+                file, hash_constructor
+            )
+        # Verify
+        assert file_digest_calls == [hash_constructor]
+        assert calculated_digest == hash_constructor(file_path.read_bytes()).hexdigest()
+        # Cleanup - none
+
+    @pytest.mark.parametrize(
+        'file_name, hash_constructor, buffer_size', [
+            ('test_file_1.txt', hashlib.md5, 1024 * 1024),
+            ('test_file_1.txt', hashlib.sha256, 1024 * 1024),
+            ('test_file_1.txt', hashlib.md5, 4096),
+            ('test_file_2.txt.bz2', hashlib.md5, 1000),
+        ]
+    )
+    def test_readinto_fallback(self, monkeypatch, file_name, hash_constructor, buffer_size):
+        # Setup
+        file_path = pathlib.Path(__file__).resolve().parent / 'static_data' / file_name
+        monkeypatch.setattr(data_integrity, 'MAXIMUM_MEMORY_MAPPED_FILE_SIZE', 0)
+        monkeypatch.setattr(data_integrity, 'CHECKSUM_BUFFER_SIZE', buffer_size)
+        monkeypatch.delattr(hashlib, 'file_digest', raising=False)
+        # Exercise
+        with file_path.open('rb') as file:
+            calculated_digest = data_integrity.calculate_file_object_checksum(
+                file, hash_constructor
+            )
+        # Verify
+        assert calculated_digest == hash_constructor(file_path.read_bytes()).hexdigest()
+        # Cleanup - none
+
+
 class TestCheckSize:
     @pytest.mark.parametrize(
         'file_path, true_file_size', [
@@ -1,7 +1,10 @@
 import datetime
+import errno
 import os
 import pathlib
 
+import pytest
+
 from datavault_api_client import post_download_processing as pdp
 from datavault_api_client.data_structures import (
     ConcurrentDownloadManifest,
@@ -155,6 +158,91 @@ class TestGetPartitionsDownloadDetails:
         # Cleanup - none
 
 
+class TestGroupPartitionsByParentFile:
+    def test_grouping_of_partitions(
+        self,
+        mocked_partitions_download_details_multiple_sources_single_day,
+    ):
+        # Setup
+        partitions = mocked_partitions_download_details_multiple_sources_single_day
+        # Exercise
+        partitions_by_parent_file = pdp.group_partitions_by_parent_file(partitions)
+        # Verify
+        expected_parent_file_names = {partition.parent_file_name for partition in partitions}
+        assert set(partitions_by_parent_file) == expected_parent_file_names
+        for parent_file_name, file_partitions in partitions_by_parent_file.items():
+            assert file_partitions == [
+                partition for partition in partitions
+                if partition.parent_file_name == parent_file_name
+            ]
+        # Cleanup - none
+
+    def test_empty_partitions_scenario(self):
+        # Setup - none
+        # Exercise
+        partitions_by_parent_file = pdp.group_partitions_by_parent_file([])
+        # Verify
+        assert partitions_by_parent_file == {}
+        # Cleanup - none
+
+
+class TestGetPartitionFileNames:
+    def test_listing_of_partition_file_names(self, tmp_path):
+        # Setup
+        partition_file_names = [
+            'WATCHLIST_367_20200721_1.txt',
+            'WATCHLIST_367_20200721_2.txt',
+            'WATCHLIST_367_20200721_10.txt',
+        ]
+        for file_name in partition_file_names:
+            (tmp_path / file_name).touch()
+        (tmp_path / 'WATCHLIST_367_20200721.txt.bz2').touch()
+        # Exercise
+        listed_file_names = pdp.get_partition_file_names(tmp_path)
+        # Verify
+        assert sorted(listed_file_names) == sorted(partition_file_names)
+        # Cleanup - none
+
+    def test_listing_matches_glob(self, tmp_path):
+        # Setup
+        (tmp_path / 'WATCHLIST_367_20200721_1.txt').touch()
+        (tmp_path / 'WATCHLIST_367_20200721.txt.bz2').touch()
+        (tmp_path / '.hidden.txt').touch()
+        (tmp_path / 'folder.txt').mkdir()
+        # Exercise
+        listed_file_names = pdp.get_partition_file_names(tmp_path)
+        # Verify
+        assert sorted(listed_file_names) == sorted(
+            path.name for path in tmp_path.glob('*.txt')
+        )
+        # Cleanup - none
+
+    def test_listing_of_non_existing_folder(self, tmp_path):
+        # Setup - none
+        # Exercise
+        listed_file_names = pdp.get_partition_file_names(tmp_path / 'missing')
+        # Verify
+        assert listed_file_names == []
+        # Cleanup - none
+
+
+class TestGetPartitionIndex:
+    @pytest.mark.parametrize(
+        'partition_file_name, expected_partition_index', [
+            ('WATCHLIST_367_20200721_1.txt', 1),
+            ('WATCHLIST_367_20200721_15.txt', 15),
+            ('CROSSREF_207_20200721_3.txt', 3),
+        ]
+    )
+    def test_partition_index_parsing(self, partition_file_name, expected_partition_index):
+        # Setup - none
+        # Exercise
+        partition_index = pdp.get_partition_index(partition_file_name)
+        # Verify
+        assert partition_index == expected_partition_index
+        # Cleanup - none
+
+
 class TestGetListOfDownloadedPartitions:
     def test_retrieval_of_downloaded_partitions(self, simulated_downloaded_partitions):
         # Setup
@@ -640,6 +728,30 @@ class TestGetAllMissingPartitions:
         for directory in list(directory_root.glob('**/'))[::-1]:
             directory.rmdir()
 
+    def test_scenario_without_partitioned_files(
+        self,
+        monkeypatch,
+        mocked_whole_files_download_details_single_source_single_day,
+        mocked_partitions_download_details_multiple_sources_single_day,
+    ):
+        # Setup
+        non_partitioned_files = pdp.get_non_partitioned_files(
+            mocked_whole_files_download_details_single_source_single_day,
+        )
+
+        def get_partition_file_names(path_to_folder):
+            raise AssertionError(f'Unexpected scan of {path_to_folder}')
+
+        monkeypatch.setattr(pdp, 'get_partition_file_names', get_partition_file_names)
+        # Exercise
+        missing_partitions = pdp.get_all_missing_partitions(
+            non_partitioned_files,
+            mocked_partitions_download_details_multiple_sources_single_day,
+        )
+        # Verify
+        assert missing_partitions == []
+        # Cleanup - none
+
 
 class TestGetFilesWithMissingPartitions:
     def test_identification_of_files_with_missing_partitions(
@@ -853,6 +965,77 @@ class TestGetFilesReadyForConcatenation:
         assert files_ready_for_concatenation == []
         # Cleanup - none
 
+    def test_partitioned_files_passed_by_the_caller(
+        self,
+        monkeypatch,
+        mocked_download_details_multiple_sources_single_day,
+    ):
+        # Setup
+        whole_files_download_details = mocked_download_details_multiple_sources_single_day
+        partitioned_files = pdp.get_partitioned_files(whole_files_download_details)
+
+        def get_partitioned_files(whole_files_reference_data):
+            raise AssertionError('The partitioned files were filtered again')
+
+        monkeypatch.setattr(pdp, 'get_partitioned_files', get_partitioned_files)
+        # Exercise
+        files_ready_for_concatenation = pdp.get_files_ready_for_concatenation(
+            whole_files_download_details,
+            [],
+            partitioned_files=partitioned_files,
+        )
+        # Verify
+        assert files_ready_for_concatenation == partitioned_files
+        # Cleanup - none
+
+
+class TestPreallocateFile:
+    @pytest.mark.parametrize(
+        'error_number, is_error_raised', [
+            (errno.EOPNOTSUPP, False),
+            (errno.ENOSYS, False),
+            (errno.EINVAL, False),
+            (errno.ENOSPC, True),
+            (errno.EIO, True),
+        ]
+    )
+    def test_handling_of_preallocation_errors(
+        self, monkeypatch, tmp_path, error_number, is_error_raised
+    ):
+        # Setup
+        def posix_fallocate(fd, offset, length):
+            raise OSError(error_number, os.strerror(error_number))
+
+        monkeypatch.setattr(os, 'posix_fallocate', posix_fallocate, raising=False)
+        # Exercise
+        with (tmp_path / 'output.txt.bz2').open('wb') as file:
+            if is_error_raised:
+                # Verify
+                with pytest.raises(OSError) as raised_error:
+                    pdp.preallocate_file(file, 1024)
+                assert raised_error.value.errno == error_number
+            else:
+                pdp.preallocate_file(file, 1024)
+        # Cleanup - none
+
+
+class TestAppendFileContent:
+    def test_appending_of_file_content(self, tmp_path):
+        # Setup
+        source_content = os.urandom(5000)
+        destination_content = os.urandom(500)
+        path_to_source = tmp_path / 'source.txt'
+        path_to_source.write_bytes(source_content)
+        path_to_destination = tmp_path / 'destination.txt.bz2'
+        # Exercise
+        with path_to_destination.open('wb') as destination:
+            destination.write(destination_content)
+            with path_to_source.open('rb') as source:
+                pdp.append_file_content(source, destination)
+        # Verify
+        assert path_to_destination.read_bytes() == destination_content + source_content
+        # Cleanup - none
+
 
 class TestConcatenatePartitions:
     def test_concatenation_of_files(self):
@@ -1013,6 +1196,46 @@ class TestConcatenateEachFilePartitions:
             directory.rmdir()
 
 
+class TestConcatenateFilePartitions:
+    @pytest.mark.parametrize(
+        'existing_output_file, expected_outcome', [
+            ('missing', True),
+            ('complete', False),
+            ('incomplete', True),
+        ]
+    )
+    def test_concatenation_of_partitions(
+        self,
+        mocked_partitioned_file_on_disk,
+        existing_output_file,
+        expected_outcome,
+    ):
+        # Setup
+        file_download_details, file_content = mocked_partitioned_file_on_disk
+        path_to_output_file = file_download_details.file_path
+        if existing_output_file == 'complete':
+            path_to_output_file.write_bytes(file_content)
+        elif existing_output_file == 'incomplete':
+            path_to_output_file.write_bytes(bytes(len(file_content)))
+        # Exercise
+        outcome = pdp.concatenate_file_partitions(file_download_details)
+        # Verify
+        assert outcome is expected_outcome
+        assert path_to_output_file.read_bytes() == file_content
+        assert list(path_to_output_file.parent.glob('*.txt')) == []
+        # Cleanup - none
+
+    def test_complete_files_are_not_returned_for_testing(self, mocked_partitioned_file_on_disk):
+        # Setup
+        file_download_details, file_content = mocked_partitioned_file_on_disk
+        file_download_details.file_path.write_bytes(file_content)
+        # Exercise
+        files_to_test = pdp.concatenate_each_file_partitions([file_download_details])
+        # Verify
+        assert files_to_test == []
+        # Cleanup - none
+
+
 class TestFilterFilesReadyForIntegrityTest:
     def test_no_file_with_missing_partitions_scenario(
         self,
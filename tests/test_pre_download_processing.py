@@ -28,6 +28,27 @@ class TestGenerateFilePathMatchingDatavaultStructure:
         assert generated_file_path == expected_file_path
         # Cleanup - none
 
+    def test_file_path_generation_from_url_without_scheme(self):
+        # Setup
+        file_download_url = (
+            "api.icedatavault.icedataservices.com/v2/data/2020/07/22/S905/WATCHLIST/"
+            "20200722-S905_WATCHLIST_username_0_0"
+        )
+        path_to_data_folder = pathlib.Path(__file__).resolve().parent.joinpath("Data").as_posix()
+        file_name = "WATCHLIST_905_20200722.txt.bz2"
+        # Exercise
+        generated_file_path = pdp.generate_file_path_matching_datavault_structure(
+            path_to_data_folder,
+            file_name,
+            file_download_url,
+        )
+        # Verify
+        expected_file_path = pathlib.Path(__file__).resolve().parent.joinpath(
+            "Data", "2020", "07", "22", "S905", "WATCHLIST", "WATCHLIST_905_20200722.txt.bz2"
+        )
+        assert generated_file_path == expected_file_path
+        # Cleanup - none
+
 
 class TestConvertMbToBytes:
     @pytest.mark.parametrize(
@@ -1233,6 +1254,32 @@ class TestGeneratePartitionDownloadUrl:
         # Cleanup - none
 
 
+class TestCreatePartitionDownloadUrlPrefix:
+    @pytest.mark.parametrize(
+        "whole_file_download_url",
+        [
+            "https://api.icedatavault.icedataservices.com/v2/data/2020/07/22/"
+            "S905/WATCHLIST/20200722-S905_WATCHLIST_username_0_0",
+            "https://api.icedatavault.icedataservices.com/v2/data/2020/07/22/"
+            "S905/WATCHLIST/20200722-S905_WATCHLIST_username_0_0/",
+        ],
+    )
+    def test_prefix_matches_partition_download_url(self, whole_file_download_url):
+        # Setup
+        partition_extremities = {"start": 24536669, "end": 25217299}
+        # Exercise
+        download_url_prefix = pdp.create_partition_download_url_prefix(whole_file_download_url)
+        # Verify
+        assert download_url_prefix == (
+            "https://api.icedatavault.icedataservices.com/v2/data/2020/07/22/"
+            "S905/WATCHLIST/20200722-S905_WATCHLIST_username_0_0?"
+        )
+        assert pdp.format_partition_download_url(
+            download_url_prefix, partition_extremities
+        ) == pdp.create_partition_download_url(whole_file_download_url, partition_extremities)
+        # Cleanup - none
+
+
 class TestGeneratePathToFilePartition:
     @pytest.mark.parametrize(
         "partition_index, correct_path_to_file_partition",
@@ -1295,6 +1342,29 @@ class TestGeneratePathToFilePartition:
         # Cleanup - none
 
 
+class TestGetPartitionPathComponents:
+    def test_extraction_of_partition_path_components(self):
+        # Setup
+        path_to_folder = (
+            pathlib.Path(__file__).resolve().parent
+            / "Data"
+            / "2020"
+            / "07"
+            / "22"
+            / "S905"
+            / "WATCHLIST"
+        )
+        path_to_file = path_to_folder / "WATCHLIST_905_20200722.txt.bz2"
+        # Exercise
+        partition_path_components = pdp.get_partition_path_components(path_to_file)
+        # Verify
+        assert partition_path_components == (path_to_folder, "WATCHLIST_905_20200722", ".txt")
+        assert pdp.format_path_to_file_partition(
+            partition_path_components, 3
+        ) == path_to_folder / "WATCHLIST_905_20200722_3.txt"
+        # Cleanup - none
+
+
 class TestCreateListOfFileSpecificPartitionsDownloadInfo:
     def test_generation_list_of_partitions_download_info(
         self,